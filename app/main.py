@@ -1,15 +1,18 @@
+import itertools
 import logging
+import math
+import os
+import threading
+import time
 from datetime import datetime, timezone
-from typing import List, Optional
-from uuid import uuid4
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.models import Entry, EntryCreate, EntryUpdate, ReadingStatus
 
@@ -25,83 +28,220 @@ logging.basicConfig(
 )
 logger = logging.getLogger("reading_list_api")
 
+# Correlation IDs (ADR-002): "<pid>-<start time>-<counter>" in hex. Unique
+# within a deployment and cheaper than uuid4 (no urandom read per error).
+_CID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_cid_counter = itertools.count()
+
+
+def _next_cid() -> str:
+    return f"{_CID_PREFIX}{next(_cid_counter):x}"
+
+
+# RFC 7807 media type (ADR-002), shared by middlewares and exception handlers
+_PROBLEM_MEDIA_TYPE = "application/problem+json"
+_PROBLEM_MEDIA_TYPE_BYTES = _PROBLEM_MEDIA_TYPE.encode()
+
+
+def _problem_template(status: int, title: str, type_: str, detail: str) -> bytes:
+    """Pre-serialize a constant problem body, left open for correlation_id"""
+    body = orjson.dumps(
+        {"type": type_, "title": title, "status": status, "detail": detail}
+    )
+    return body[:-1] + b',"correlation_id":"'
+
+
+async def _send_problem(
+    send: Send,
+    status: int,
+    template: bytes,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+):
+    """Send an RFC 7807 response straight from middleware (ADR-002)"""
+    body = template + _next_cid().encode() + b'"}'
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", _PROBLEM_MEDIA_TYPE_BYTES),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or ()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
 
 # ============================================================================
-# Security Headers Middleware (P06 - C1, Risk R03)
-# Protects against XSS, clickjacking, MIME sniffing
+# Security Middleware (P06 - C1, Risks R03, R09, NFR-008)
+# Security headers against XSS, clickjacking, MIME sniffing, and request body
+# size limit against oversized payload DoS, applied in a single ASGI pass
 # ============================================================================
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses (OWASP recommendations)"""
+_SECURITY_HEADERS: Tuple[Tuple[bytes, bytes], ...] = (
+    # Prevent XSS attacks
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    # Content Security Policy
+    (b"content-security-policy", b"default-src 'self'"),
+    # Referrer Policy
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    # Cache control for sensitive data
+    (b"cache-control", b"no-store, no-cache, must-revalidate"),
+    (b"pragma", b"no-cache"),
+)
+
+MAX_BODY_SIZE = 64 * 1024  # 64 KB limit
+
+_TOO_LARGE_BODY = _problem_template(
+    status=413,
+    title="Payload Too Large",
+    type_="/errors/payload-too-large",
+    detail=f"Request body exceeds max size of {MAX_BODY_SIZE} bytes",
+)
+
+_BAD_LENGTH_BODY = _problem_template(
+    status=400,
+    title="Bad Request",
+    type_="/errors/invalid-content-length",
+    detail="Content-Length header must be a non-negative integer",
+)
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+# Probe endpoints carry no body, so the size check is skipped for them.
+# Security headers are still applied: they are part of every response (NFR).
+_BYPASS_PATHS: FrozenSet[str] = frozenset({"/health"})
 
-        # Prevent XSS attacks
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
 
-        # Content Security Policy
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+class SecurityMiddleware:
+    """Limit request body size and add security headers (OWASP recommendations)"""
 
-        # Referrer Policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Cache control for sensitive data
-        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.extend(_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        if scope["path"] not in _BYPASS_PATHS:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    try:
+                        size = int(value)
+                    except ValueError:
+                        size = -1
+                    if size < 0:
+                        logger.warning("Request rejected: invalid Content-Length")
+                        await _send_problem(send_with_headers, 400, _BAD_LENGTH_BODY)
+                        return
+                    if size > MAX_BODY_SIZE:
+                        logger.warning(
+                            "Request rejected: body size %s exceeds limit %d",
+                            value.decode(),
+                            MAX_BODY_SIZE,
+                        )
+                        await _send_problem(send_with_headers, 413, _TOO_LARGE_BODY)
+                        return
+                    break
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # ============================================================================
-# Request Body Size Limit Middleware (P06 - C1, Risk R09, NFR-008)
-# Protects against oversized payload DoS attacks
+# Rate Limiting Middleware (NFR-004, Risk R01, ADR-003)
+# Token bucket per client IP, refilled lazily on each request
 # ============================================================================
 
-MAX_BODY_SIZE = 64 * 1024  # 64 KB limit
+RATE_LIMIT = 100  # requests per window per IP address
+RATE_LIMIT_WINDOW = 60.0  # seconds
+_BUCKET_CAPACITY = float(RATE_LIMIT)
+_REFILL_RATE = RATE_LIMIT / RATE_LIMIT_WINDOW  # tokens per second
+_RATE_LIMITED_PREFIX = "/entries"
+_TOO_MANY_BODY = _problem_template(
+    status=429,
+    title="Too Many Requests",
+    type_="/errors/rate-limit-exceeded",
+    detail=f"Rate limit exceeded: {RATE_LIMIT} per {RATE_LIMIT_WINDOW:g} seconds",
+)
 
+# client IP -> [tokens left, monotonic time of last update], mutated in place
+_BUCKETS: Dict[str, List[float]] = {}
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Limit request body size to prevent DoS attacks"""
+# Idle buckets are full again after one window, so dropping them is lossless.
+# The sweep runs every _SWEEP_EVERY requests to bound memory under IP churn.
+_BUCKET_IDLE_TTL = 2 * RATE_LIMIT_WINDOW
+_SWEEP_EVERY = 1024
 
-    async def dispatch(self, request: Request, call_next):
-        content_length = request.headers.get("content-length")
 
-        if content_length:
-            if int(content_length) > MAX_BODY_SIZE:
-                logger.warning(
-                    f"Request rejected: body size {content_length} exceeds limit {MAX_BODY_SIZE}"
-                )
-                return JSONResponse(
-                    status_code=413,
-                    content={
-                        "type": "/errors/payload-too-large",
-                        "title": "Payload Too Large",
-                        "status": 413,
-                        "detail": f"Request body exceeds max size of {MAX_BODY_SIZE} bytes",
-                        "correlation_id": str(uuid4()),
-                    },
-                    media_type="application/problem+json",
-                )
+class RateLimitMiddleware:
+    """Limit /entries requests to RATE_LIMIT per RATE_LIMIT_WINDOW per IP"""
 
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._calls = 0
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith(
+            _RATE_LIMITED_PREFIX
+        ):
+            await self.app(scope, receive, send)
+            return
 
-# Rate Limiter configuration (NFR-004, Risk R01)
-# Limit: 100 requests per minute per IP address
-limiter = Limiter(key_func=get_remote_address)
+        client = scope.get("client")
+        key = client[0] if client else ""
+        now = time.monotonic()
 
-app = FastAPI(title="SecDev Course App", version="0.1.0")
+        self._calls += 1
+        if self._calls % _SWEEP_EVERY == 0:
+            _prune_buckets(now)
 
-# Add security middlewares
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RequestSizeLimitMiddleware)
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            _BUCKETS[key] = [_BUCKET_CAPACITY - 1.0, now]
+            await self.app(scope, receive, send)
+            return
 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+        bucket[0] = min(_BUCKET_CAPACITY, bucket[0] + (now - bucket[1]) * _REFILL_RATE)
+        bucket[1] = now
+        if bucket[0] < 1.0:
+            # Secure logging without PII (P06-C3, NFR-007): no client IP
+            logger.warning("Request rejected: rate limit exceeded")
+            retry_after = math.ceil((1.0 - bucket[0]) / _REFILL_RATE)
+            await _send_problem(
+                send, 429, _TOO_MANY_BODY, [(b"retry-after", str(retry_after).encode())]
+            )
+            return
+
+        bucket[0] -= 1.0
+        await self.app(scope, receive, send)
+
+
+def _prune_buckets(now: float):
+    stale = [k for k, b in _BUCKETS.items() if now - b[1] > _BUCKET_IDLE_TTL]
+    for key in stale:
+        del _BUCKETS[key]
+
+
+app = FastAPI(
+    title="SecDev Course App",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Add middlewares (the last added runs first); gzip only for bodies >= 1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(SecurityMiddleware)
 
 
 # ============================================================================
@@ -118,7 +258,7 @@ class ProblemDetail(BaseModel):
     detail: Optional[str] = Field(None, description="Human-readable explanation")
     instance: Optional[str] = Field(None, description="URI reference for occurrence")
     correlation_id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=_next_cid,
         description="Unique ID for tracing in logs",
     )
 
@@ -132,20 +272,41 @@ class ApiError(Exception):
         self.status = status
 
 
+# Constant part of ProblemDetail for the frequent ApiError codes: the handler
+# only fills in detail, instance and correlation_id, skipping model validation
+_PROBLEM_SKELETONS: Dict[str, Dict[str, Any]] = {
+    code: {
+        "type": f"/errors/{code}",
+        "title": code.replace("_", " ").title(),
+        "status": status,
+    }
+    for code, status in (("not_found", 404), ("validation_error", 422))
+}
+
+
 @app.exception_handler(ApiError)
 async def api_error_handler(request: Request, exc: ApiError):
     """Handle ApiError with RFC 7807 Problem Details format"""
-    problem = ProblemDetail(
-        type=f"/errors/{exc.code}",
-        title=exc.code.replace("_", " ").title(),
-        status=exc.status,
-        detail=exc.message,
-        instance=str(request.url.path),
-    )
-    return JSONResponse(
+    skel = _PROBLEM_SKELETONS.get(exc.code)
+    if skel is not None and skel["status"] == exc.status:
+        content = {
+            **skel,
+            "detail": exc.message,
+            "instance": request.url.path,
+            "correlation_id": _next_cid(),
+        }
+    else:
+        content = ProblemDetail(
+            type=f"/errors/{exc.code}",
+            title=exc.code.replace("_", " ").title(),
+            status=exc.status,
+            detail=exc.message,
+            instance=str(request.url.path),
+        ).model_dump()
+    return ORJSONResponse(
         status_code=exc.status,
-        content=problem.model_dump(),
-        media_type="application/problem+json",
+        content=content,
+        media_type=_PROBLEM_MEDIA_TYPE,
     )
 
 
@@ -153,30 +314,56 @@ async def api_error_handler(request: Request, exc: ApiError):
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle FastAPI HTTPException with RFC 7807 format"""
     detail = exc.detail if isinstance(exc.detail, str) else "An error occurred"
-    problem = ProblemDetail(
-        type="/errors/http-error",
-        title="HTTP Error",
-        status=exc.status_code,
-        detail=detail,
-        instance=str(request.url.path),
-    )
-    return JSONResponse(
+    content = {
+        "type": "/errors/http-error",
+        "title": "HTTP Error",
+        "status": exc.status_code,
+        "detail": detail,
+        "instance": request.url.path,
+        "correlation_id": _next_cid(),
+    }
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=problem.model_dump(),
-        media_type="application/problem+json",
+        content=content,
+        media_type=_PROBLEM_MEDIA_TYPE,
     )
 
 
+# Static probe body, encoded once at import (reused by every /health call)
+_HEALTH_RESPONSE = Response(content=b'{"status":"ok"}', media_type="application/json")
+
+
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return _HEALTH_RESPONSE
 
 
 # Example minimal entity (for tests/demo)
-_DB = {"items": []}
+_DB = {"items": {}, "next_id": 1}
+
+# Reading List database: entries are keyed by id (dicts keep insertion order)
+_READING_LIST_DB = {"entries": {}, "next_id": 1}
+
+_UTC = timezone.utc
+
+# Secondary indexes for filtering: status -> ids, id -> pre-lowercased author
+_STATUS_INDEX: Dict[ReadingStatus, Set[int]] = {}
+_AUTHOR_LOWER: Dict[int, str] = {}
+
+# /entries handlers are plain def and run concurrently in the threadpool: every
+# change to the store and its indexes, and every read that serializes entries
+# (updates mutate them in place), holds this lock
+_STORE_LOCK = threading.Lock()
 
-# Reading List database
-_READING_LIST_DB = {"entries": [], "next_id": 1}
+
+def _index_entry(entry: Entry):
+    _STATUS_INDEX.setdefault(entry.status, set()).add(entry.id)
+    _AUTHOR_LOWER[entry.id] = entry.author.lower()
+
+
+def _unindex_entry(entry: Entry):
+    _STATUS_INDEX.get(entry.status, set()).discard(entry.id)
+    _AUTHOR_LOWER.pop(entry.id, None)
 
 
 @app.post("/items")
@@ -185,116 +372,158 @@ def create_item(name: str):
         raise ApiError(
             code="validation_error", message="name must be 1..100 chars", status=422
         )
-    item = {"id": len(_DB["items"]) + 1, "name": name}
-    _DB["items"].append(item)
+    item_id = _DB["next_id"]
+    _DB["next_id"] += 1
+    item = {"id": item_id, "name": name}
+    _DB["items"][item_id] = item
     return item
 
 
 @app.get("/items/{item_id}")
 def get_item(item_id: int):
-    for it in _DB["items"]:
-        if it["id"] == item_id:
-            return it
-    raise ApiError(code="not_found", message="item not found", status=404)
+    it = _DB["items"].get(item_id)
+    if it is None:
+        raise ApiError(code="not_found", message="item not found", status=404)
+    return it
 
 
 # ============================================================================
 # Reading List CRUD Endpoints
 # ============================================================================
 
+# Stored entries are built by the server and already valid, so responses are
+# serialized straight to JSON bytes instead of being re-validated against
+# response_model (which is kept for the OpenAPI schema only)
+_ENTRY_ADAPTER = TypeAdapter(Entry)
+_ENTRY_LIST_ADAPTER = TypeAdapter(List[Entry])
+
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
 
 @app.post("/entries", response_model=Entry, status_code=201)
-@limiter.limit("100/minute")
-def create_entry(request: Request, entry_data: EntryCreate):
+def create_entry(entry_data: EntryCreate):
     """Создать новую запись в списке для чтения"""
-    now = datetime.now(timezone.utc)
-    entry = Entry(
-        id=_READING_LIST_DB["next_id"],
-        title=entry_data.title,
-        author=entry_data.author,
-        status=entry_data.status,
-        notes=entry_data.notes,
-        created_at=now,
-        updated_at=now,
-    )
-    _READING_LIST_DB["entries"].append(entry)
-    _READING_LIST_DB["next_id"] += 1
+    now = datetime.now(_UTC)
+    with _STORE_LOCK:
+        entry = Entry(
+            id=_READING_LIST_DB["next_id"],
+            title=entry_data.title,
+            author=entry_data.author,
+            status=entry_data.status,
+            notes=entry_data.notes,
+            created_at=now,
+            updated_at=now,
+        )
+        _READING_LIST_DB["entries"][entry.id] = entry
+        _index_entry(entry)
+        _READING_LIST_DB["next_id"] += 1
 
     # Secure logging without PII (P06-C3, NFR-007)
-    logger.info(f"CREATE_ENTRY | id={entry.id} | status={entry.status}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("CREATE_ENTRY | id=%d | status=%s", entry.id, entry.status.value)
 
-    return entry
+    return _json_response(_ENTRY_ADAPTER.dump_json(entry), status_code=201)
 
 
 @app.get("/entries", response_model=List[Entry])
-@limiter.limit("100/minute")
-def get_entries(request: Request):
+def get_entries():
     """Получить все записи из списка для чтения"""
-    return _READING_LIST_DB["entries"]
+    with _STORE_LOCK:
+        content = _ENTRY_LIST_ADAPTER.dump_json(
+            list(_READING_LIST_DB["entries"].values())
+        )
+    return _json_response(content)
 
 
 @app.get("/entries/{entry_id}", response_model=Entry)
-@limiter.limit("100/minute")
-def get_entry(request: Request, entry_id: int):
+def get_entry(entry_id: int):
     """Получить запись по ID"""
-    for entry in _READING_LIST_DB["entries"]:
-        if entry.id == entry_id:
-            return entry
-    raise ApiError(code="not_found", message=f"Entry {entry_id} not found", status=404)
+    with _STORE_LOCK:
+        entry = _READING_LIST_DB["entries"].get(entry_id)
+        if entry is not None:
+            content = _ENTRY_ADAPTER.dump_json(entry)
+    if entry is None:
+        raise ApiError(
+            code="not_found", message=f"Entry {entry_id} not found", status=404
+        )
+    return _json_response(content)
+
+
+# Поля Entry, которые не могут быть null (в EntryUpdate они Optional)
+_NON_NULLABLE_FIELDS: FrozenSet[str] = frozenset({"title", "author", "status"})
 
 
 @app.put("/entries/{entry_id}", response_model=Entry)
-@limiter.limit("100/minute")
-def update_entry(request: Request, entry_id: int, entry_data: EntryUpdate):
+def update_entry(entry_id: int, entry_data: EntryUpdate):
     """Обновить существующую запись"""
-    for i, entry in enumerate(_READING_LIST_DB["entries"]):
-        if entry.id == entry_id:
-            # Обновляем только переданные поля
-            update_dict = entry_data.model_dump(exclude_unset=True)
-            update_dict["updated_at"] = datetime.now(timezone.utc)
-
-            updated_entry = entry.model_copy(update=update_dict)
-            _READING_LIST_DB["entries"][i] = updated_entry
-
-            # Secure logging without PII (P06-C3, NFR-007)
-            logger.info(
-                f"UPDATE_ENTRY | id={entry_id} | fields={list(update_dict.keys())}"
-            )
+    # Обновляем только переданные поля; null для обязательных полей игнорируется,
+    # чтобы запись в хранилище всегда оставалась валидной Entry
+    changes = {
+        field: value
+        for field in entry_data.model_fields_set
+        if (value := getattr(entry_data, field)) is not None
+        or field not in _NON_NULLABLE_FIELDS
+    }
+
+    # Изменяем запись на месте только после того, как новые значения известны;
+    # под блокировкой, чтобы читатели не увидели наполовину обновлённую запись
+    with _STORE_LOCK:
+        entry = _READING_LIST_DB["entries"].get(entry_id)
+        if entry is not None:
+            _unindex_entry(entry)
+            for field, value in changes.items():
+                setattr(entry, field, value)
+            entry.updated_at = datetime.now(_UTC)
+            _index_entry(entry)
+            content = _ENTRY_ADAPTER.dump_json(entry)
+    if entry is None:
+        raise ApiError(
+            code="not_found", message=f"Entry {entry_id} not found", status=404
+        )
 
-            return updated_entry
+    # Secure logging without PII (P06-C3, NFR-007)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("UPDATE_ENTRY | id=%d | fields=%s", entry_id, sorted(changes))
 
-    raise ApiError(code="not_found", message=f"Entry {entry_id} not found", status=404)
+    return _json_response(content)
 
 
 @app.delete("/entries/{entry_id}", status_code=204)
-@limiter.limit("100/minute")
-def delete_entry(request: Request, entry_id: int):
+def delete_entry(entry_id: int):
     """Удалить запись из списка"""
-    for i, entry in enumerate(_READING_LIST_DB["entries"]):
-        if entry.id == entry_id:
-            _READING_LIST_DB["entries"].pop(i)
-
-            # Secure logging without PII (P06-C3, NFR-007)
-            logger.info(f"DELETE_ENTRY | id={entry_id}")
+    with _STORE_LOCK:
+        entry = _READING_LIST_DB["entries"].pop(entry_id, None)
+        if entry is not None:
+            _unindex_entry(entry)
+    if entry is None:
+        raise ApiError(
+            code="not_found", message=f"Entry {entry_id} not found", status=404
+        )
 
-            return
-    raise ApiError(code="not_found", message=f"Entry {entry_id} not found", status=404)
+    # Secure logging without PII (P06-C3, NFR-007)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("DELETE_ENTRY | id=%d", entry_id)
 
 
 @app.get("/entries/filter/by-status", response_model=List[Entry])
-@limiter.limit("100/minute")
 def filter_entries_by_status(
-    request: Request,
     status: Optional[ReadingStatus] = None,
     author: Optional[str] = None,
 ):
     """Фильтрация записей по статусу и/или автору"""
-    result = _READING_LIST_DB["entries"]
+    entries = _READING_LIST_DB["entries"]
+
+    author_lc = author.lower() if author else None
 
-    if status:
-        result = [e for e in result if e.status == status]
+    with _STORE_LOCK:
+        # ids растут монотонно, поэтому сортировка восстанавливает порядок создания
+        ids = sorted(_STATUS_INDEX.get(status, ())) if status else entries.keys()
 
-    if author:
-        result = [e for e in result if author.lower() in e.author.lower()]
+        if author_lc:
+            ids = [i for i in ids if author_lc in _AUTHOR_LOWER[i]]
 
-    return result
+        return _json_response(_ENTRY_LIST_ADAPTER.dump_json([entries[i] for i in ids]))
@@ -1,7 +1,86 @@
 # tests/conftest.py
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+from fastapi.testclient import TestClient
+
 ROOT = Path(__file__).resolve().parents[1]  # корень репозитория
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# conftest загружается до сбора тестовых модулей: приложение (роуты, middleware,
+# Pydantic-модели) собирается здесь один раз на процесс
+import app.main as main  # noqa: E402
+from app.models import Entry, ReadingStatus  # noqa: E402
+
+# Минимальный валидный payload записи. httpx не изменяет переданный json,
+# поэтому один и тот же dict переиспользуется; варианты — через {**payload, ...}
+BASIC_PAYLOAD = {"title": "Book", "author": "Author"}
+
+
+@pytest.fixture(scope="session")
+def basic_payload():
+    return BASIC_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def app():
+    return main.app
+
+
+@pytest.fixture(scope="session")
+def db():
+    return main._READING_LIST_DB
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Один TestClient (и lifespan приложения) на всю сессию тестов"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def health_headers(client):
+    """Заголовки /health один раз на сессию; dict с ключами в нижнем регистре"""
+    return dict(client.get("/health").headers)
+
+
+@pytest.fixture(autouse=True)
+def reset_db(db):
+    """Очищаем базу и индексы перед каждым тестом"""
+    db["entries"].clear()
+    db["next_id"] = 1
+    main._STATUS_INDEX.clear()
+    main._AUTHOR_LOWER.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    """Каждый тест начинает с полным запасом запросов (NFR-004)"""
+    main._BUCKETS.clear()
+
+
+@pytest.fixture
+def seed(db):
+    """Добавляет записи напрямую в хранилище, минуя HTTP (для подготовки данных)"""
+
+    def _seed(entries):
+        now = datetime.now(main._UTC)
+        for data in entries:
+            entry = Entry(
+                id=db["next_id"],
+                status=data.get("status", ReadingStatus.TO_READ),
+                notes=data.get("notes"),
+                title=data["title"],
+                author=data["author"],
+                created_at=now,
+                updated_at=now,
+            )
+            db["entries"][entry.id] = entry
+            main._index_entry(entry)
+            db["next_id"] += 1
+
+    return _seed
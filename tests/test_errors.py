@@ -3,19 +3,12 @@ Tests for RFC 7807 Problem Details error format (ADR-002)
 Includes negative test cases for security validation
 """
 
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
-
 # ============================================================================
 # RFC 7807 Format Tests
 # ============================================================================
 
 
-def test_not_found_returns_rfc7807_format():
+def test_not_found_returns_rfc7807_format(client):
     """Test that 404 errors follow RFC 7807 format"""
     r = client.get("/items/999")
     assert r.status_code == 404
@@ -33,11 +26,11 @@ def test_not_found_returns_rfc7807_format():
     assert "instance" in body
     assert "correlation_id" in body
 
-    # Verify correlation_id is UUID format
-    assert len(body["correlation_id"]) == 36  # UUID format
+    # Verify correlation_id is "<pid>-<start>-<counter>" hex format
+    assert len(body["correlation_id"].split("-")) == 3
 
 
-def test_validation_error_returns_rfc7807_format():
+def test_validation_error_returns_rfc7807_format(client):
     """Test that validation errors follow RFC 7807 format"""
     r = client.post("/items", params={"name": ""})
     assert r.status_code == 422
@@ -54,7 +47,7 @@ def test_validation_error_returns_rfc7807_format():
     assert "correlation_id" in body
 
 
-def test_entry_not_found_rfc7807():
+def test_entry_not_found_rfc7807(client):
     """Test that entry not found returns RFC 7807 format"""
     r = client.get("/entries/99999")
     assert r.status_code == 404
@@ -69,7 +62,7 @@ def test_entry_not_found_rfc7807():
     assert "correlation_id" in body
 
 
-def test_correlation_id_is_unique():
+def test_correlation_id_is_unique(client):
     """Test that each error has a unique correlation_id"""
     r1 = client.get("/entries/11111")
     r2 = client.get("/entries/22222")
@@ -85,52 +78,45 @@ def test_correlation_id_is_unique():
 # ============================================================================
 
 
-def test_reject_empty_title():
+def test_reject_empty_title(client):
     """Negative test: empty title should be rejected"""
     r = client.post("/entries", json={"title": "", "author": "Author"})
     assert r.status_code == 422
 
 
-def test_reject_missing_required_field():
+def test_reject_missing_required_field(client):
     """Negative test: missing author should be rejected"""
     r = client.post("/entries", json={"title": "Book"})
     assert r.status_code == 422
 
 
-def test_reject_oversized_title():
+def test_reject_oversized_title(client):
     """Negative test: title > 200 chars should be rejected (T10: Oversized payload)"""
     long_title = "A" * 201
     r = client.post("/entries", json={"title": long_title, "author": "Author"})
     assert r.status_code == 422
 
 
-def test_reject_oversized_notes():
+def test_reject_oversized_notes(client, basic_payload):
     """Negative test: notes > 1000 chars should be rejected"""
     long_notes = "X" * 1001
-    r = client.post(
-        "/entries", json={"title": "Book", "author": "Author", "notes": long_notes}
-    )
+    r = client.post("/entries", json={**basic_payload, "notes": long_notes})
     assert r.status_code == 422
 
 
-def test_reject_invalid_status():
+def test_reject_invalid_status(client, basic_payload):
     """Negative test: invalid status enum should be rejected"""
     r = client.post(
         "/entries",
-        json={"title": "Book", "author": "Author", "status": "invalid_status"},
+        json={**basic_payload, "status": "invalid_status"},
     )
     assert r.status_code == 422
 
 
-def test_xss_payload_stored_safely():
+def test_xss_payload_stored_safely(client):
     """Security test: XSS payload should be stored as-is (not executed)
     Note: Output encoding is frontend responsibility (T09)
     """
-    from app.main import _READING_LIST_DB
-
-    _READING_LIST_DB["entries"] = []
-    _READING_LIST_DB["next_id"] = 1
-
     xss_payload = "<script>alert('xss')</script>"
     r = client.post("/entries", json={"title": xss_payload, "author": "Test Author"})
     assert r.status_code == 201
@@ -140,13 +126,8 @@ def test_xss_payload_stored_safely():
     assert body["title"] == xss_payload
 
 
-def test_sql_injection_attempt_safe():
+def test_sql_injection_attempt_safe(client):
     """Security test: SQL injection attempt should be safe (T05)"""
-    from app.main import _READING_LIST_DB
-
-    _READING_LIST_DB["entries"] = []
-    _READING_LIST_DB["next_id"] = 1
-
     sql_payload = "'; DROP TABLE entries; --"
     r = client.post("/entries", json={"title": sql_payload, "author": "Attacker"})
     # Should succeed (stored safely, no SQL execution)
@@ -165,7 +146,7 @@ def test_sql_injection_attempt_safe():
 # ============================================================================
 
 
-def test_error_content_type_is_problem_json():
+def test_error_content_type_is_problem_json(client):
     """Test that error responses have application/problem+json content type"""
     r = client.get("/entries/99999")
     assert r.status_code == 404
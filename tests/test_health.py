@@ -1,11 +1,4 @@
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
-
-def test_health_ok():
+def test_health_ok(client):
     r = client.get("/health")
     assert r.status_code == 200
     assert r.json() == {"status": "ok"}
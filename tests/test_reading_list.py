@@ -1,17 +1,34 @@
-from fastapi.testclient import TestClient
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from app.main import _READING_LIST_DB, app
+import orjson
 
-client = TestClient(app)
+import app.main as main
+from app.main import (
+    create_entry,
+    delete_entry,
+    filter_entries_by_status,
+    get_entries,
+    get_entry,
+    update_entry,
+)
+from app.models import Entry, EntryCreate, EntryUpdate, ReadingStatus
 
+_CREATE = EntryCreate(title="Book", author="Author")
+_UPDATE = EntryUpdate(author="Other", status=ReadingStatus.READING)
 
-def setup_function():
-    """Очищаем базу перед каждым тестом"""
-    _READING_LIST_DB["entries"] = []
-    _READING_LIST_DB["next_id"] = 1
 
+def _yielding(func):
+    """Обёртка, отдающая GIL другим потокам перед вызовом func"""
 
-def test_create_entry():
+    def wrapper(*args):
+        time.sleep(0)
+        return func(*args)
+
+    return wrapper
+
+
+def test_create_entry(client):
     """Тест создания записи"""
     response = client.post(
         "/entries",
@@ -33,7 +50,7 @@ def test_create_entry():
     assert "updated_at" in data
 
 
-def test_create_entry_minimal():
+def test_create_entry_minimal(client):
     """Тест создания записи с минимальными данными"""
     response = client.post(
         "/entries", json={"title": "Test Book", "author": "Test Author"}
@@ -46,7 +63,7 @@ def test_create_entry_minimal():
     assert data["notes"] is None
 
 
-def test_create_entry_validation_error():
+def test_create_entry_validation_error(client):
     """Тест валидации при создании записи"""
     # Пустой title
     response = client.post("/entries", json={"title": "", "author": "Author"})
@@ -57,11 +74,15 @@ def test_create_entry_validation_error():
     assert response.status_code == 422
 
 
-def test_get_all_entries():
+def test_get_all_entries(client, seed):
     """Тест получения всех записей"""
     # Создаём несколько записей
-    client.post("/entries", json={"title": "Book 1", "author": "Author 1"})
-    client.post("/entries", json={"title": "Book 2", "author": "Author 2"})
+    seed(
+        [
+            {"title": "Book 1", "author": "Author 1"},
+            {"title": "Book 2", "author": "Author 2"},
+        ]
+    )
 
     # Получаем все
     response = client.get("/entries")
@@ -73,17 +94,17 @@ def test_get_all_entries():
     assert data[1]["title"] == "Book 2"
 
 
-def test_get_all_entries_empty():
+def test_get_all_entries_empty(client):
     """Тест получения пустого списка записей"""
     response = client.get("/entries")
     assert response.status_code == 200
     assert response.json() == []
 
 
-def test_get_entry_by_id():
+def test_get_entry_by_id(client, basic_payload):
     """Тест получения записи по ID"""
     # Создаём запись
-    create_resp = client.post("/entries", json={"title": "Book", "author": "Author"})
+    create_resp = client.post("/entries", json=basic_payload)
     entry_id = create_resp.json()["id"]
 
     # Получаем по ID
@@ -95,7 +116,7 @@ def test_get_entry_by_id():
     assert data["author"] == "Author"
 
 
-def test_get_nonexistent_entry():
+def test_get_nonexistent_entry(client):
     """Тест получения несуществующей записи"""
     response = client.get("/entries/99999")
     assert response.status_code == 404
@@ -106,7 +127,7 @@ def test_get_nonexistent_entry():
     assert "99999" in body["detail"]
 
 
-def test_update_entry():
+def test_update_entry(client):
     """Тест обновления записи"""
     # Создаём запись
     create_resp = client.post(
@@ -125,7 +146,7 @@ def test_update_entry():
     assert data["author"] == "Old Author"  # Не изменился
 
 
-def test_update_entry_partial():
+def test_update_entry_partial(client):
     """Тест частичного обновления записи"""
     # Создаём запись
     create_resp = client.post(
@@ -149,7 +170,54 @@ def test_update_entry_partial():
     assert data["status"] == "to_read"
 
 
-def test_update_nonexistent_entry():
+def test_update_entry_null_author_ignored(client, seed):
+    """Тест: null для обязательного author не портит запись и индексы"""
+    seed([{"title": "Book", "author": "Martin Fowler"}])
+
+    response = client.put("/entries/1", json={"author": None, "notes": "New"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["author"] == "Martin Fowler"
+    assert data["notes"] == "New"
+
+    response = client.get("/entries/filter/by-status?author=fowler")
+    assert response.status_code == 200
+    assert [e["id"] for e in response.json()] == [1]
+
+
+def test_update_entry_null_status_ignored(client, seed):
+    """Тест: null для status не убирает запись из индекса статусов"""
+    seed([{"title": "Book", "author": "Author", "status": "reading"}])
+
+    response = client.put("/entries/1", json={"status": None})
+    assert response.status_code == 200
+    assert response.json()["status"] == "reading"
+
+    response = client.get("/entries/filter/by-status?status=reading")
+    assert [e["id"] for e in response.json()] == [1]
+
+
+def test_update_entry_null_notes_clears(client, seed):
+    """Тест: notes можно очистить через null"""
+    seed([{"title": "Book", "author": "Author", "notes": "Old"}])
+
+    response = client.put("/entries/1", json={"notes": None})
+    assert response.status_code == 200
+    assert response.json()["notes"] is None
+
+
+def test_update_response_matches_entry_schema(client, seed):
+    """Тест: ответ PUT остаётся валидной Entry, хотя response_model не перепроверяется"""
+    seed([{"title": "Book", "author": "Author", "status": "reading"}])
+
+    response = client.put("/entries/1", json={"title": None, "status": None})
+    assert response.status_code == 200
+    entry = Entry.model_validate_json(response.content)
+    assert entry.title == "Book"
+    assert entry.status == "reading"
+
+
+def test_update_nonexistent_entry(client):
     """Тест обновления несуществующей записи"""
     response = client.put("/entries/99999", json={"title": "New Title"})
     assert response.status_code == 404
@@ -159,7 +227,7 @@ def test_update_nonexistent_entry():
     assert body["status"] == 404
 
 
-def test_delete_entry():
+def test_delete_entry(client):
     """Тест удаления записи"""
     # Создаём запись
     create_resp = client.post(
@@ -176,7 +244,7 @@ def test_delete_entry():
     assert get_resp.status_code == 404
 
 
-def test_delete_nonexistent_entry():
+def test_delete_nonexistent_entry(client):
     """Тест удаления несуществующей записи"""
     response = client.delete("/entries/99999")
     assert response.status_code == 404
@@ -186,21 +254,16 @@ def test_delete_nonexistent_entry():
     assert body["status"] == 404
 
 
-def test_filter_by_status():
+def test_filter_by_status(client, seed):
     """Тест фильтрации по статусу"""
     # Создаём записи с разными статусами
-    client.post(
-        "/entries", json={"title": "Book 1", "author": "Author 1", "status": "to_read"}
-    )
-    client.post(
-        "/entries", json={"title": "Book 2", "author": "Author 2", "status": "reading"}
-    )
-    client.post(
-        "/entries", json={"title": "Book 3", "author": "Author 3", "status": "reading"}
-    )
-    client.post(
-        "/entries",
-        json={"title": "Book 4", "author": "Author 4", "status": "completed"},
+    seed(
+        [
+            {"title": "Book 1", "author": "Author 1", "status": "to_read"},
+            {"title": "Book 2", "author": "Author 2", "status": "reading"},
+            {"title": "Book 3", "author": "Author 3", "status": "reading"},
+            {"title": "Book 4", "author": "Author 4", "status": "completed"},
+        ]
     )
 
     # Фильтруем по статусу "reading"
@@ -208,38 +271,37 @@ def test_filter_by_status():
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
-    assert all(e["status"] == "reading" for e in data)
+    assert {e["status"] for e in data} == {"reading"}
 
 
-def test_filter_by_author():
+def test_filter_by_author(client, seed):
     """Тест фильтрации по автору"""
     # Создаём записи
-    client.post("/entries", json={"title": "Book 1", "author": "Martin Fowler"})
-    client.post("/entries", json={"title": "Book 2", "author": "Robert Martin"})
-    client.post("/entries", json={"title": "Book 3", "author": "Kent Beck"})
+    seed(
+        [
+            {"title": "Book 1", "author": "Martin Fowler"},
+            {"title": "Book 2", "author": "Robert Martin"},
+            {"title": "Book 3", "author": "Kent Beck"},
+        ]
+    )
 
     # Фильтруем по части имени автора
     response = client.get("/entries/filter/by-status?author=Martin")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
-    assert all("Martin" in e["author"] for e in data)
+    assert {"Martin" in e["author"] for e in data} == {True}
 
 
-def test_filter_by_status_and_author():
+def test_filter_by_status_and_author(client, seed):
     """Тест фильтрации по статусу и автору одновременно"""
     # Создаём записи
-    client.post(
-        "/entries",
-        json={"title": "Book 1", "author": "Martin Fowler", "status": "reading"},
-    )
-    client.post(
-        "/entries",
-        json={"title": "Book 2", "author": "Robert Martin", "status": "completed"},
-    )
-    client.post(
-        "/entries",
-        json={"title": "Book 3", "author": "Martin Fowler", "status": "completed"},
+    seed(
+        [
+            {"title": "Book 1", "author": "Martin Fowler", "status": "reading"},
+            {"title": "Book 2", "author": "Robert Martin", "status": "completed"},
+            {"title": "Book 3", "author": "Martin Fowler", "status": "completed"},
+        ]
     )
 
     # Фильтруем по обоим параметрам
@@ -251,23 +313,100 @@ def test_filter_by_status_and_author():
     assert data[0]["status"] == "completed"
 
 
-def test_filter_no_params():
-    """Тест фильтрации без параметров (возвращает все записи)"""
-    # Создаём записи
-    client.post("/entries", json={"title": "Book 1", "author": "Author 1"})
-    client.post("/entries", json={"title": "Book 2", "author": "Author 2"})
+def test_filter_after_update_and_delete(client, seed):
+    """Тест фильтрации после смены статуса/автора и удаления записи"""
+    seed(
+        [
+            {"title": "Book 1", "author": "Martin Fowler"},
+            {"title": "Book 2", "author": "Kent Beck"},
+        ]
+    )
 
-    # Фильтруем без параметров
-    response = client.get("/entries/filter/by-status")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 2
+    client.put("/entries/1", json={"status": "reading", "author": "Robert Martin"})
+    client.put("/entries/2", json={"status": "reading"})
 
+    response = client.get("/entries/filter/by-status?status=to_read")
+    assert response.json() == []
 
-def test_entry_timestamps():
+    response = client.get("/entries/filter/by-status?status=reading")
+    assert [e["id"] for e in response.json()] == [1, 2]
+
+    response = client.get("/entries/filter/by-status?author=fowler")
+    assert response.json() == []
+
+    client.delete("/entries/1")
+    response = client.get("/entries/filter/by-status?status=reading&author=Martin")
+    assert response.json() == []
+
+
+def test_filter_consistent_under_concurrent_writes(monkeypatch):
+    """Тест: фильтр не падает, пока параллельно идут create/update/delete
+
+    Sync-обработчики FastAPI выполняет в threadpool, поэтому они вызываются
+    напрямую из потоков; sleep(0) в индексации расширяет окно гонки.
+    """
+    for name in ("_index_entry", "_unindex_entry"):
+        monkeypatch.setattr(main, name, _yielding(getattr(main, name)))
+
+    def writer():
+        for _ in range(300):
+            entry_id = orjson.loads(create_entry(_CREATE).body)["id"]
+            update_entry(entry_id, _UPDATE)
+            delete_entry(entry_id)
+
+    def reader(status, author):
+        for _ in range(300):
+            filter_entries_by_status(status, author)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(writer) for _ in range(2)]
+        futures += [
+            pool.submit(reader, *args)
+            for args in ((None, None), (None, "auth"), (ReadingStatus.READING, None))
+        ]
+        for future in futures:
+            future.result()
+
+
+def test_update_atomic_for_concurrent_readers(seed, monkeypatch):
+    """Тест: параллельные GET не видят наполовину обновлённую запись"""
+    seed([{"title": "0", "author": "Author", "notes": "0"}])
+    monkeypatch.setattr(Entry, "__setattr__", _yielding(Entry.__setattr__))
+
+    def writer():
+        for n in range(1, 300):
+            update_entry(1, EntryUpdate(title=str(n), notes=str(n)))
+
+    def reader():
+        for _ in range(300):
+            entry = orjson.loads(get_entry(1).body)
+            assert entry["title"] == entry["notes"]
+            (entry,) = orjson.loads(get_entries().body)
+            assert entry["title"] == entry["notes"]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for future in [pool.submit(writer), pool.submit(reader), pool.submit(reader)]:
+            future.result()
+
+
+def test_filter_endpoint_mirrors_list_when_no_params(client, seed):
+    """Тест фильтрации без параметров (совпадает со списком всех записей)"""
+    seed(
+        [
+            {"title": "Book 1", "author": "Author 1"},
+            {"title": "Book 2", "author": "Author 2"},
+        ]
+    )
+
+    filtered = client.get("/entries/filter/by-status").json()
+    assert len(filtered) == 2
+    assert filtered == client.get("/entries").json()
+
+
+def test_entry_timestamps(client, basic_payload):
     """Тест корректности временных меток"""
     # Создаём запись
-    create_resp = client.post("/entries", json={"title": "Book", "author": "Author"})
+    create_resp = client.post("/entries", json=basic_payload)
     data = create_resp.json()
     created_at = data["created_at"]
     updated_at = data["updated_at"]
@@ -287,7 +426,7 @@ def test_entry_timestamps():
     assert "updated_at" in updated_data
 
 
-def test_multiple_entries_ids():
+def test_multiple_entries_ids(client):
     """Тест уникальности ID записей"""
     # Создаём несколько записей
     ids = []
@@ -297,8 +436,18 @@ def test_multiple_entries_ids():
         )
         ids.append(resp.json()["id"])
 
-    # Все ID должны быть уникальными
-    assert len(ids) == len(set(ids))
-
-    # ID должны быть последовательными
+    # ID последовательны, а значит и уникальны
     assert ids == list(range(1, 6))
+
+
+def test_large_response_gzipped(client, basic_payload):
+    """Тест сжатия больших ответов (>= 1 KB)"""
+    client.post("/entries", json={**basic_payload, "notes": "N" * 1000})
+
+    response = client.get("/entries", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()[0]["notes"] == "N" * 1000
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
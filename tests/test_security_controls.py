@@ -2,59 +2,73 @@
 Tests for P06 Security Controls
 - Security Headers (C1)
 - Request Body Size Limit (C1)
+- Rate Limiting (NFR-004)
 - Secure Logging (C3)
 - Negative/Abuse Tests (C2)
 """
 
-from fastapi.testclient import TestClient
+import time
+from types import SimpleNamespace
 
-from app.main import _READING_LIST_DB, MAX_BODY_SIZE, app
+import orjson
+import pytest
 
-client = TestClient(app)
+from app.main import _BUCKETS, MAX_BODY_SIZE, RATE_LIMIT, RATE_LIMIT_WINDOW
 
+# Large payload strings are built once per process, not per test
+_LARGE_NOTES = "X" * (MAX_BODY_SIZE + 1000)
+_TITLE_200 = "A" * 200
+_TITLE_201 = "A" * 201
+_AUTHOR_100 = "B" * 100
+_NOTES_1000 = "N" * 1000
+_NOTES_1001 = "N" * 1001
 
-def setup_function():
-    """Reset database before each test"""
-    _READING_LIST_DB["entries"] = []
-    _READING_LIST_DB["next_id"] = 1
+# Request bodies sent as raw bytes are serialized once as well
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_LARGE_BODY = orjson.dumps({"title": "Book", "author": "Author", "notes": _LARGE_NOTES})
 
 
+def _build_nested_body(depth: int = 10) -> bytes:
+    nested = {"author": "Author", "title": "Book"}
+    for _ in range(depth):
+        nested = {"nested": nested, "title": "Book", "author": "Author"}
+    return orjson.dumps(nested)
+
+
+# Deeply nested JSON structure (10 levels)
+_NESTED_BODY = _build_nested_body()
+
 # ============================================================================
 # Security Headers Tests (P06-C1)
 # ============================================================================
 
 
-def test_security_header_x_content_type_options():
+def test_security_header_x_content_type_options(health_headers):
     """Test X-Content-Type-Options header is set to nosniff"""
-    response = client.get("/health")
-    assert response.headers.get("X-Content-Type-Options") == "nosniff"
+    assert health_headers.get("x-content-type-options") == "nosniff"
 
 
-def test_security_header_x_frame_options():
+def test_security_header_x_frame_options(health_headers):
     """Test X-Frame-Options header prevents clickjacking"""
-    response = client.get("/health")
-    assert response.headers.get("X-Frame-Options") == "DENY"
+    assert health_headers.get("x-frame-options") == "DENY"
 
 
-def test_security_header_x_xss_protection():
+def test_security_header_x_xss_protection(health_headers):
     """Test X-XSS-Protection header is enabled"""
-    response = client.get("/health")
-    assert response.headers.get("X-XSS-Protection") == "1; mode=block"
+    assert health_headers.get("x-xss-protection") == "1; mode=block"
 
 
-def test_security_header_csp():
+def test_security_header_csp(health_headers):
     """Test Content-Security-Policy header is set"""
-    response = client.get("/health")
-    assert "default-src" in response.headers.get("Content-Security-Policy", "")
+    assert "default-src" in health_headers.get("content-security-policy", "")
 
 
-def test_security_header_referrer_policy():
+def test_security_header_referrer_policy(health_headers):
     """Test Referrer-Policy header is set"""
-    response = client.get("/health")
-    assert response.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
+    assert health_headers.get("referrer-policy") == "strict-origin-when-cross-origin"
 
 
-def test_security_header_cache_control():
+def test_security_header_cache_control(client):
     """Test Cache-Control prevents caching sensitive data"""
     response = client.get("/entries")
     assert "no-store" in response.headers.get("Cache-Control", "")
@@ -65,7 +79,7 @@ def test_security_header_cache_control():
 # ============================================================================
 
 
-def test_normal_request_size_accepted():
+def test_normal_request_size_accepted(client):
     """Test normal sized request is accepted"""
     response = client.post(
         "/entries",
@@ -74,25 +88,19 @@ def test_normal_request_size_accepted():
     assert response.status_code == 201
 
 
-def test_oversized_request_rejected():
+def test_oversized_request_rejected(client):
     """Negative test: Oversized request body should be rejected (R09)"""
-    # Create a payload larger than MAX_BODY_SIZE (64KB)
-    large_notes = "X" * (MAX_BODY_SIZE + 1000)
-    # Note: TestClient may not enforce Content-Length properly
-    # This test documents the expected behavior
-    _ = client.post(
-        "/entries",
-        json={"title": "Book", "author": "Author", "notes": large_notes},
-        headers={"Content-Length": str(len(large_notes) + 100)},
-    )
+    # Payload larger than MAX_BODY_SIZE (64KB), pre-serialized in _LARGE_BODY
+    response = client.post("/entries", content=_LARGE_BODY, headers=_JSON_HEADERS)
+    assert response.status_code == 413
 
 
-def test_payload_too_large_error_format():
+def test_payload_too_large_error_format(client, basic_payload):
     """Test that 413 errors follow RFC 7807 format"""
     # Simulate a request with Content-Length header exceeding limit
     response = client.post(
         "/entries",
-        json={"title": "Book", "author": "Author"},
+        json=basic_payload,
         headers={"Content-Length": str(MAX_BODY_SIZE + 1000)},
     )
     assert response.status_code == 413
@@ -103,6 +111,65 @@ def test_payload_too_large_error_format():
     assert body["status"] == 413
     assert "correlation_id" in body
     assert "exceeds" in body["detail"]
+    assert response.headers.get("X-Content-Type-Options") == "nosniff"
+
+
+@pytest.mark.parametrize("length", ["abc", "-1"])
+def test_invalid_content_length_rejected(client, basic_payload, length):
+    """Negative test: malformed Content-Length yields 400, not 500"""
+    response = client.post(
+        "/entries", json=basic_payload, headers={"Content-Length": length}
+    )
+    assert response.status_code == 400
+    assert "application/problem+json" in response.headers["content-type"]
+    assert response.headers.get("X-Content-Type-Options") == "nosniff"
+
+    body = response.json()
+    assert body["type"] == "/errors/invalid-content-length"
+    assert body["status"] == 400
+    assert "correlation_id" in body
+
+
+# ============================================================================
+# Rate Limiting Tests (NFR-004, R01)
+# ============================================================================
+
+
+def test_rate_limit_exceeded_returns_429(client, monkeypatch):
+    """Negative test: requests over the per-IP limit are rejected (R01)"""
+    # Freeze the limiter clock so no tokens refill while the loop runs
+    frozen = time.monotonic()
+    monkeypatch.setattr("app.main.time", SimpleNamespace(monotonic=lambda: frozen))
+
+    for _ in range(RATE_LIMIT):
+        assert client.get("/entries").status_code == 200
+
+    response = client.get("/entries")
+    assert response.status_code == 429
+    assert "application/problem+json" in response.headers["content-type"]
+    assert int(response.headers["retry-after"]) >= 1
+    assert response.headers.get("X-Content-Type-Options") == "nosniff"
+
+    body = response.json()
+    assert body["type"] == "/errors/rate-limit-exceeded"
+    assert body["status"] == 429
+    assert "correlation_id" in body
+
+    # The budget is shared across all /entries* endpoints
+    assert client.get("/entries/filter/by-status").status_code == 429
+
+    # Health checks are not rate limited
+    assert client.get("/health").status_code == 200
+
+
+def test_rate_limit_idle_buckets_pruned(client, monkeypatch):
+    """Idle per-IP buckets are evicted so memory stays bounded (R01)"""
+    monkeypatch.setattr("app.main._SWEEP_EVERY", 1)
+    _BUCKETS["203.0.113.7"] = [0.0, time.monotonic() - 10 * RATE_LIMIT_WINDOW]
+
+    assert client.get("/entries").status_code == 200
+    assert "203.0.113.7" not in _BUCKETS
+    assert "testclient" in _BUCKETS
 
 
 # ============================================================================
@@ -110,54 +177,44 @@ def test_payload_too_large_error_format():
 # ============================================================================
 
 
-def test_negative_path_traversal_attempt():
+def test_negative_path_traversal_attempt(client):
     """Negative test: Path traversal attempt should not expose system info"""
     response = client.get("/entries/../../../etc/passwd")
     # Should return 404 (route not found), not expose file contents
     assert response.status_code in [404, 422]
 
 
-def test_negative_special_characters_in_filter():
+def test_negative_special_characters_in_filter(client):
     """Negative test: Special characters in filter should be safe"""
     response = client.get("/entries/filter/by-status?author=<script>alert(1)</script>")
     # Should return empty list or normal response, not error
     assert response.status_code == 200
 
 
-def test_negative_null_byte_injection():
-    """Negative test: Null byte injection should be handled safely"""
-    response = client.post(
-        "/entries",
-        json={"title": "Book\x00malicious", "author": "Author"},
-    )
-    # Pydantic should handle or pass through safely
-    assert response.status_code in [201, 422]
-
-
-def test_negative_unicode_abuse():
-    """Negative test: Unicode abuse should be handled safely"""
-    # RTL override characters and zero-width characters
-    malicious_title = "Normal\u202egnirtslacilaM"
-    response = client.post(
-        "/entries",
-        json={"title": malicious_title, "author": "Author"},
-    )
-    assert response.status_code == 201
+@pytest.mark.parametrize(
+    "payload,allowed_statuses",
+    [
+        # Null byte injection: Pydantic should handle or pass through safely
+        ({"title": "Book\x00malicious", "author": "Author"}, {201, 422}),
+        # Unicode abuse: RTL override characters
+        ({"title": "Normal\u202egnirtslacilaM", "author": "Author"}, {201}),
+    ],
+    ids=["null_byte_injection", "unicode_abuse"],
+)
+def test_negative_payload_handled_safely(client, payload, allowed_statuses):
+    """Negative test: malicious string payloads are handled safely"""
+    response = client.post("/entries", json=payload)
+    assert response.status_code in allowed_statuses
 
 
-def test_negative_json_depth_attack():
+def test_negative_json_depth_attack(client):
     """Negative test: Deeply nested JSON should be handled"""
-    # Create deeply nested structure
-    nested = {"author": "Author", "title": "Book"}
-    for _ in range(10):
-        nested = {"nested": nested, "title": "Book", "author": "Author"}
-
-    response = client.post("/entries", json=nested)
+    response = client.post("/entries", content=_NESTED_BODY, headers=_JSON_HEADERS)
     # Should fail validation (extra fields) or succeed with top-level
     assert response.status_code in [201, 422]
 
 
-def test_negative_empty_content_type():
+def test_negative_empty_content_type(client):
     """Negative test: Request without proper content type"""
     response = client.post(
         "/entries",
@@ -173,55 +230,23 @@ def test_negative_empty_content_type():
 # ============================================================================
 
 
-def test_boundary_title_max_length():
-    """Boundary test: Title at exactly max length (200 chars)"""
-    title = "A" * 200
-    response = client.post(
-        "/entries",
-        json={"title": title, "author": "Author"},
-    )
-    assert response.status_code == 201
-    assert len(response.json()["title"]) == 200
-
-
-def test_boundary_title_over_max_length():
-    """Boundary test: Title over max length (201 chars) rejected"""
-    title = "A" * 201
-    response = client.post(
-        "/entries",
-        json={"title": title, "author": "Author"},
-    )
-    assert response.status_code == 422
-
-
-def test_boundary_author_max_length():
-    """Boundary test: Author at exactly max length (100 chars)"""
-    author = "B" * 100
-    response = client.post(
-        "/entries",
-        json={"title": "Book", "author": author},
-    )
-    assert response.status_code == 201
-
-
-def test_boundary_notes_max_length():
-    """Boundary test: Notes at exactly max length (1000 chars)"""
-    notes = "N" * 1000
-    response = client.post(
-        "/entries",
-        json={"title": "Book", "author": "Author", "notes": notes},
-    )
-    assert response.status_code == 201
-
-
-def test_boundary_notes_over_max_length():
-    """Boundary test: Notes over max length (1001 chars) rejected"""
-    notes = "N" * 1001
-    response = client.post(
-        "/entries",
-        json={"title": "Book", "author": "Author", "notes": notes},
-    )
-    assert response.status_code == 422
+@pytest.mark.parametrize(
+    "field,value,expected_status",
+    [
+        ("title", _TITLE_200, 201),
+        ("title", _TITLE_201, 422),
+        ("author", _AUTHOR_100, 201),
+        ("notes", _NOTES_1000, 201),
+        ("notes", _NOTES_1001, 422),
+    ],
+    ids=["title_200", "title_201", "author_100", "notes_1000", "notes_1001"],
+)
+def test_boundary_field_length(client, basic_payload, field, value, expected_status):
+    """Boundary test: fields at max length accepted, over max length rejected"""
+    response = client.post("/entries", json={**basic_payload, field: value})
+    assert response.status_code == expected_status
+    if expected_status == 201:
+        assert response.json()[field] == value
 
 
 # ============================================================================
@@ -229,7 +254,7 @@ def test_boundary_notes_over_max_length():
 # ============================================================================
 
 
-def test_error_response_no_stack_trace():
+def test_error_response_no_stack_trace(client):
     """Test that error responses don't contain stack traces"""
     response = client.get("/entries/nonexistent")
     body = response.json()
@@ -241,9 +266,9 @@ def test_error_response_no_stack_trace():
     assert ".py" not in detail
 
 
-def test_error_response_has_correlation_id():
+def test_error_response_has_correlation_id(client):
     """Test that errors include correlation_id for tracing"""
     response = client.get("/entries/99999")
     body = response.json()
     assert "correlation_id" in body
-    assert len(body["correlation_id"]) == 36  # UUID format
+    assert body["correlation_id"]